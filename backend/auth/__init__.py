@@ -5,8 +5,8 @@ from .auth_schemas import (
     UserRegister,
     UserLogin,
     Token,
-    TokenPayload,
     UserResponse,
+    UserResponseMsg,
 )
 from .auth_dependencies import get_current_user, get_current_active_user
 
@@ -15,8 +15,8 @@ __all__ = [
     "UserRegister",
     "UserLogin",
     "Token",
-    "TokenPayload",
     "UserResponse",
+    "UserResponseMsg",
     "get_current_user",
     "get_current_active_user",
 ]
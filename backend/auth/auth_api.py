@@ -2,18 +2,18 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import get_db
 from .auth_schemas import UserRegister, UserLogin, Token, UserResponse
 from .auth_service import (
-    get_user_by_email,
     create_user,
     authenticate_user,
     create_access_token,
 )
 from .auth_dependencies import get_current_active_user
+from .auth_helper import user_response
 from .auth_models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -27,7 +27,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 async def register(
     user_data: UserRegister,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> UserResponse:
+) -> Response:
     """
     Register a new user account.
 
@@ -41,15 +41,13 @@ async def register(
     Raises:
         HTTPException: If email already exists.
     """
-    existing_user = await get_user_by_email(db, user_data.email)
-    if existing_user:
+    user = await create_user(db, user_data)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
-
-    user = await create_user(db, user_data)
-    return UserResponse.model_validate(user)
+    return user_response(user, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=Token)
@@ -91,7 +89,7 @@ async def login(
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> UserResponse:
+) -> Response:
     """
     Get current authenticated user information.
 
@@ -101,7 +99,7 @@ async def get_current_user_info(
     Returns:
         User details.
     """
-    return UserResponse.model_validate(current_user)
+    return user_response(current_user)
 
 
 @router.post("/refresh", response_model=Token)
@@ -1,9 +1,10 @@
 """Authentication dependencies for FastAPI."""
 
+import re
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.connection import get_db
@@ -11,19 +12,48 @@ from common.exceptions import AuthenticationError
 from .auth_models import User
 from .auth_service import decode_token, get_user_by_id
 
+_BEARER_RE = re.compile(r"Bearer\s+([A-Za-z0-9\-_.]+)$", re.IGNORECASE)
+
+
+class BearerToken(HTTPBearer):
+    """HTTP Bearer scheme that extracts the token with one regex match."""
+
+    async def __call__(self, request: Request) -> str:  # type: ignore[override]
+        """
+        Extract the bearer token from the Authorization header.
+
+        Args:
+            request: Incoming request.
+
+        Returns:
+            Raw token string.
+
+        Raises:
+            HTTPException: If the header is missing or malformed.
+        """
+        match = _BEARER_RE.match(request.headers.get("authorization", ""))
+        if match is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return match.group(1)
+
+
 # HTTP Bearer token security scheme
-security = HTTPBearer()
+security = BearerToken(scheme_name="HTTPBearer")
 
 
 async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    token: Annotated[str, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
     """
     Get the current authenticated user from JWT token.
 
     Args:
-        credentials: HTTP Bearer token credentials.
+        token: HTTP Bearer token.
         db: Database session.
 
     Returns:
@@ -33,8 +63,8 @@ async def get_current_user(
         HTTPException: If token is invalid or user not found.
     """
     try:
-        token_payload = decode_token(credentials.credentials)
-        user = await get_user_by_id(db, token_payload.sub)
+        user_id, _ = decode_token(token)
+        user = await get_user_by_id(db, user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,36 @@
+"""Authentication helper functions."""
+
+import msgspec
+from fastapi import Response, status
+
+from .auth_models import User
+from .auth_schemas import UserResponseMsg
+
+
+def user_response(user: User, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Encode a user as a JSON response.
+
+    Bypasses Pydantic validation and serialization; the payload matches
+    the UserResponse schema.
+
+    Args:
+        user: User database model.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        JSON response with the public user fields.
+    """
+    payload = UserResponseMsg(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+    return Response(
+        content=msgspec.json.encode(payload),
+        status_code=status_code,
+        media_type="application/json",
+    )
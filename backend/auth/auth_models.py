@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Boolean, DateTime, func
+from sqlalchemy import String, Boolean, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.base import Base
@@ -32,3 +32,7 @@ class User(Base):
     def __repr__(self) -> str:
         """String representation."""
         return f"<User(id={self.id}, email={self.email})>"
+
+
+# Case-insensitive uniqueness; backs email lookups and the register upsert
+Index("uq_users_email_lower", func.lower(User.email), unique=True)
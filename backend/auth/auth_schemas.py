@@ -3,21 +3,32 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+import msgspec
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 
 
 class UserRegister(BaseModel):
     """Schema for user registration."""
 
     email: EmailStr
-    password: str = Field(..., min_length=8, max_length=128)
+    password: str = Field(..., min_length=8, max_length=72)
     name: str = Field(..., min_length=1, max_length=100)
 
+    @field_validator("password")
+    @classmethod
+    def check_password_bytes(cls, v: str) -> str:
+        """Reject passwords bcrypt cannot hash (over 72 UTF-8 bytes)."""
+        if len(v.encode("utf-8")) > 72:
+            raise ValueError("Password must be at most 72 bytes")
+        return v
+
 
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    # Plain string: lookups are normalized and matched against stored emails,
+    # so full email validation is only needed at registration.
+    email: str = Field(..., min_length=1, max_length=255)
     password: str = Field(..., min_length=1)
 
 
@@ -28,13 +39,6 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
-class TokenPayload(BaseModel):
-    """Schema for JWT token payload."""
-
-    sub: int  # User ID
-    exp: Optional[datetime] = None
-
-
 class UserResponse(BaseModel):
     """Schema for user response."""
 
@@ -46,3 +50,14 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
+
+
+class UserResponseMsg(msgspec.Struct):
+    """msgspec mirror of UserResponse used to encode user responses."""
+
+    id: int
+    email: str
+    name: str
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
@@ -1,53 +1,165 @@
 """Authentication service with business logic."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 import bcrypt
-from jose import jwt, JWTError
-from sqlalchemy import select
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+from jwt import InvalidTokenError as JWTError
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_settings
 from common.exceptions import AuthenticationError
 from .auth_models import User
-from .auth_schemas import UserRegister, TokenPayload
+from .auth_schemas import UserRegister
 
 settings = get_settings()
 
-# JWT settings
+# JWT settings, bound once at import
 ALGORITHM = "HS256"
+_SECRET = settings.secret_key
+_EXP_DELTA_SECS = settings.access_token_expire_minutes * 60
 
+# Verified tokens, keyed by a digest of the raw token string. Entries are
+# short-lived; the embedded exp is still re-checked on every hit. Like
+# _USER_CACHE, it is only touched from the event loop thread, so no lock.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
 
-def hash_password(password: str) -> str:
+# Argon2id parameters, used when password_hash_scheme is "argon2"
+_argon2_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+# Dedicated pool for password hashing. bcrypt/argon2 release the GIL, so one
+# worker per CPU runs hashes in parallel; login bursts queue here instead of
+# starving other users of the default executor. Created lazily so a new pool
+# replaces one stopped by a previous app shutdown.
+_password_executor: Optional[ThreadPoolExecutor] = None
+
+
+class AuthUser(NamedTuple):
+    """Snapshot of the user columns needed to authenticate a login."""
+
+    id: int
+    password_hash: bytes  # UTF-8 encoded once when the snapshot is taken
+    is_active: bool
+
+
+# Recent logins, keyed by lowercased email. Holds only the auth columns and
+# must be evicted whenever a user's password or active flag changes.
+_USER_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+# Built once so SQLAlchemy reuses the compiled statement on every lookup
+_AUTH_USER_BY_EMAIL = select(User.id, User.password_hash, User.is_active).where(
+    func.lower(User.email) == bindparam("email")
+)
+
+
+async def _run_password_task(fn: Callable[..., Any], *args: Any) -> Any:
     """
-    Hash a password using bcrypt.
+    Run a password hashing function on the dedicated worker pool.
 
     Args:
-        password: Plain text password.
+        fn: hash_password or verify_password.
+        *args: Positional arguments for fn.
 
     Returns:
-        Hashed password string.
+        The function's return value.
     """
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="password-hash",
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, fn, *args)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def shutdown_password_executor() -> None:
+    """Stop the password hashing worker pool, waiting for queued hashes."""
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=True)
+        _password_executor = None
+
+
+def hash_password(password: Union[str, bytes]) -> str:
+    """
+    Hash a password using the configured scheme (bcrypt or argon2).
+
+    Args:
+        password: Plain text password, as str or UTF-8 bytes.
+
+    Returns:
+        Hashed password string.
+    """
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    if settings.password_hash_scheme == "argon2":
+        return _argon2_hasher.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_cost)
+    return bcrypt.hashpw(password, salt).decode("utf-8")
+
+
+def verify_password(
+    plain_password: Union[str, bytes],
+    hashed_password: Union[str, bytes],
+) -> bool:
     """
     Verify a password against its hash.
 
     Args:
-        plain_password: Plain text password.
+        plain_password: Plain text password, as str or UTF-8 bytes.
         hashed_password: Hashed password to compare against.
 
     Returns:
         True if password matches, False otherwise.
     """
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"),
-        hashed_password.encode("utf-8"),
-    )
+    if isinstance(plain_password, str):
+        plain_password = plain_password.encode("utf-8")
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode("utf-8")
+    if hashed_password.startswith(b"$argon2"):
+        try:
+            return _argon2_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    try:
+        return bcrypt.checkpw(plain_password, hashed_password)
+    except ValueError:
+        # bcrypt 5 rejects passwords over 72 bytes; none can have been stored
+        return False
+
+
+def password_needs_rehash(hashed_password: Union[str, bytes]) -> bool:
+    """
+    Check whether a stored hash should be upgraded to the configured scheme.
+
+    Args:
+        hashed_password: Stored password hash.
+
+    Returns:
+        True if the hash uses another scheme or outdated parameters.
+    """
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode("utf-8")
+    if settings.password_hash_scheme == "argon2":
+        if not hashed_password.startswith(b"$argon2"):
+            return True
+        return _argon2_hasher.check_needs_rehash(hashed_password)
+    if hashed_password.startswith(b"$argon2"):
+        return True
+    # bcrypt hashes look like $2b$<cost>$<salt+hash>
+    return int(hashed_password.split(b"$")[2]) != settings.bcrypt_cost
 
 
 def create_access_token(
@@ -64,19 +176,16 @@ def create_access_token(
     Returns:
         Encoded JWT token string.
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+    if expires_delta is not None:
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
-
+        expire = int(time.time()) + _EXP_DELTA_SECS
     to_encode = {"sub": str(user_id), "exp": expire}
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def decode_token(token: str) -> TokenPayload:
+def decode_token(token: str) -> tuple[int, int]:
     """
     Decode and validate a JWT token.
 
@@ -84,34 +193,51 @@ def decode_token(token: str) -> TokenPayload:
         token: The JWT token string.
 
     Returns:
-        TokenPayload with user ID and expiration.
+        Tuple of (user ID, expiration as seconds since the epoch).
 
     Raises:
         AuthenticationError: If token is invalid or expired.
     """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        if cached[1] <= time.time():
+            raise AuthenticationError("Token validation failed: Signature has expired")
+        return cached
+
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise AuthenticationError("Invalid token payload")
-        return TokenPayload(sub=int(user_id), exp=payload.get("exp"))
+        payload = jwt.decode(
+            token,
+            _SECRET,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]},
+        )
+        token_payload = (int(payload["sub"]), payload["exp"])
     except JWTError as e:
         raise AuthenticationError(f"Token validation failed: {str(e)}")
+    except ValueError:
+        raise AuthenticationError("Invalid token payload")
 
+    _TOKEN_CACHE[key] = token_payload
+    return token_payload
 
-async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+
+async def get_user_for_auth(db: AsyncSession, email: str) -> Optional[AuthUser]:
     """
-    Get a user by email address.
+    Get only the columns needed to authenticate a user by email.
 
     Args:
         db: Database session.
         email: User's email address.
 
     Returns:
-        User if found, None otherwise.
+        AuthUser if found, None otherwise.
     """
-    result = await db.execute(select(User).where(User.email == email))
-    return result.scalar_one_or_none()
+    result = await db.execute(_AUTH_USER_BY_EMAIL, {"email": email.strip().lower()})
+    row = result.first()
+    if row is None:
+        return None
+    return AuthUser(row.id, row.password_hash.encode("utf-8"), row.is_active)
 
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
@@ -128,25 +254,45 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     return await db.get(User, user_id)
 
 
-async def create_user(db: AsyncSession, user_data: UserRegister) -> User:
+async def create_user(db: AsyncSession, user_data: UserRegister) -> Optional[User]:
     """
     Create a new user.
 
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING so the duplicate-email
+    check, the insert and the server defaults take one round-trip.
+
     Args:
         db: Database session.
         user_data: User registration data.
 
     Returns:
-        Created user instance.
+        Created user instance, or None if the email is already registered.
     """
     user = User(
-        email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        email=user_data.email.lower(),
+        password_hash=await _run_password_task(hash_password, user_data.password),
         name=user_data.name,
+        is_active=True,
+    )
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user.email,
+            password_hash=user.password_hash,
+            name=user.name,
+            is_active=user.is_active,
+        )
+        .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+        .returning(User.id, User.created_at)
     )
-    db.add(user)
+    row = result.first()
+    if row is None:
+        await db.rollback()
+        return None
     await db.commit()
-    await db.refresh(user)
+    # Server-generated values come back from RETURNING; updated_at is unset
+    user.id, user.created_at = row
+    _USER_CACHE.pop(user.email, None)
     return user
 
 
@@ -154,21 +300,42 @@ async def authenticate_user(
     db: AsyncSession,
     email: str,
     password: str,
-) -> Optional[User]:
+) -> Optional[AuthUser]:
     """
     Authenticate a user by email and password.
 
+    Recent lookups are served from a short-lived cache to skip the
+    database round-trip on repeated logins.
+
     Args:
         db: Database session.
         email: User's email address.
         password: Plain text password.
 
     Returns:
-        User if authentication successful, None otherwise.
+        AuthUser if authentication successful, None otherwise.
     """
-    user = await get_user_by_email(db, email)
-    if not user:
-        return None
-    if not verify_password(password, user.password_hash):
+    key = email.strip().lower()
+    auth_user = _USER_CACHE.get(key)
+    if auth_user is None:
+        auth_user = await get_user_for_auth(db, email)
+        if auth_user is None:
+            return None
+        _USER_CACHE[key] = auth_user
+
+    password_bytes = password.encode("utf-8")
+    if not await _run_password_task(
+        verify_password, password_bytes, auth_user.password_hash
+    ):
         return None
-    return user
+    if password_needs_rehash(auth_user.password_hash):
+        password_hash = await _run_password_task(hash_password, password_bytes)
+        await db.execute(
+            update(User)
+            .where(User.id == auth_user.id)
+            .values(password_hash=password_hash)
+        )
+        await db.commit()
+        auth_user = auth_user._replace(password_hash=password_hash.encode("utf-8"))
+        _USER_CACHE[key] = auth_user
+    return auth_user
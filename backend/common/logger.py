@@ -6,6 +6,38 @@ from typing import Optional
 
 from config import get_settings
 
+settings = get_settings()
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter with a per-second timestamp cache and direct %-formatting."""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt)
+        self._template = fmt
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self,
+        record: logging.LogRecord,
+        datefmt: Optional[str] = None,
+    ) -> str:
+        """Format the record time, reusing the string within the same second."""
+        second = int(record.created)
+        cached_second, asctime = self._cached_time
+        if second != cached_second:
+            asctime = super().formatTime(record, datefmt)
+            self._cached_time = (second, asctime)
+        return asctime
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, deferring to the base class for tracebacks."""
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return self._template % record.__dict__
+
 
 def setup_logger(
     name: Optional[str] = None,
@@ -21,7 +53,6 @@ def setup_logger(
     Returns:
         Configured logger instance.
     """
-    settings = get_settings()
     log_level = level or settings.log_level
 
     _logger = logging.getLogger(name)
@@ -31,7 +62,7 @@ def setup_logger(
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(getattr(logging, log_level.upper()))
 
-        formatter = logging.Formatter(
+        formatter = FastFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -1,23 +1,58 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from config import get_settings
 
 settings = get_settings()
 
+if settings.db_use_pgbouncer:
+    # pgbouncer owns connection pooling; in transaction mode a session may hop
+    # server connections, so asyncpg must not keep prepared statements, and
+    # the ones SQLAlchemy still prepares need unique names to avoid
+    # DuplicatePreparedStatementError across server connections.
+    engine_options: dict[str, Any] = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    # No pool_pre_ping: it costs a round-trip on every checkout. The
+    # tcp_keepalives_* settings are server GUCs, so they only let Postgres
+    # drop dead clients; the client side does not notice a pooled connection
+    # that died (e.g. DB restart or failover) until pool_recycle rotates it
+    # or a query on it fails. That trade-off is accepted for the saved RTT.
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "connect_args": {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": {
+                "statement_timeout": str(settings.db_statement_timeout),
+                "tcp_keepalives_idle": "30",
+                "tcp_keepalives_interval": "10",
+                "tcp_keepalives_count": "3",
+            },
+        },
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
+    **engine_options,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -18,6 +18,9 @@ CREATE TABLE IF NOT EXISTS users (
 -- Create index on email for faster lookups
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 
+-- Case-insensitive unique index for email lookups and registration upserts
+CREATE UNIQUE INDEX IF NOT EXISTS uq_users_email_lower ON users(LOWER(email));
+
 -- Insert a default admin user (password: admin123)
 INSERT INTO users (email, password_hash, name, is_active)
 VALUES (
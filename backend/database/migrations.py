@@ -0,0 +1,68 @@
+"""Idempotent schema upgrades for existing databases.
+
+There is no Alembic history yet, so init.sql only shapes fresh databases.
+These statements bring older databases up to date and are safe to re-run;
+apply them at deploy time with:
+
+    python -m database.migrations
+"""
+
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from common.exceptions import DatabaseError
+from common.logger import logger
+from .connection import engine
+
+# Lookups match on lower(email), so store emails lowercased. Rows whose
+# lowered email is already taken by another row are left for manual review.
+BACKFILL_LOWER_EMAILS = """
+    UPDATE users SET email = lower(email)
+    WHERE email <> lower(email)
+      AND NOT EXISTS (
+          SELECT 1 FROM users AS other
+          WHERE other.id <> users.id AND lower(other.email) = lower(users.email)
+      )
+"""
+
+DUPLICATE_EMAILS = """
+    SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1
+"""
+
+INDEX_MIGRATIONS: list[str] = [
+    # Case-insensitive uniqueness; also the register upsert's conflict target
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_users_email_lower ON users (lower(email))",
+]
+
+
+async def run_migrations(db_engine: AsyncEngine = engine) -> None:
+    """
+    Apply all migrations in a single transaction.
+
+    Args:
+        db_engine: Engine to migrate. Defaults to the application engine.
+
+    Raises:
+        DatabaseError: If emails differing only by case still need merging.
+    """
+    async with db_engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Pooled connections carry the request statement_timeout; the
+            # full-table backfill and index build must not be cut off by it.
+            await conn.execute(text("SET LOCAL statement_timeout = 0"))
+        await conn.execute(text(BACKFILL_LOWER_EMAILS))
+        duplicates = (await conn.execute(text(DUPLICATE_EMAILS))).scalars().all()
+        if duplicates:
+            raise DatabaseError(
+                "Resolve accounts whose emails differ only by case before "
+                f"migrating: {', '.join(duplicates)}"
+            )
+        for statement in INDEX_MIGRATIONS:
+            await conn.execute(text(statement))
+    logger.info("Database migrations applied")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_migrations())
@@ -13,6 +13,7 @@ from main import app
 from database.base import Base
 from database.connection import get_db
 from auth.auth_models import User  # noqa: F401 - Import to register model with Base
+from auth.auth_service import _TOKEN_CACHE, _USER_CACHE
 
 
 # Test database URL (use SQLite for tests)
@@ -27,6 +28,14 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches() -> Generator[None, None, None]:
+    """Reset process-local auth caches so tests don't share state."""
+    yield
+    _TOKEN_CACHE.clear()
+    _USER_CACHE.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine():
     """Create a test database engine."""
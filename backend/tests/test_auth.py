@@ -1,9 +1,26 @@
 """Tests for authentication endpoints."""
 
+from datetime import timedelta
+
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
-
-from auth.auth_service import hash_password, create_access_token
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.auth_models import User
+from main import app
+from auth.auth_service import (
+    AuthUser,
+    _USER_CACHE,
+    hash_password,
+    verify_password,
+    password_needs_rehash,
+    create_access_token,
+    decode_token,
+    settings,
+)
+from common.exceptions import AuthenticationError
 
 
 class TestRegister:
@@ -49,6 +66,29 @@ class TestRegister:
         assert response.status_code == 400
         assert "already registered" in response.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_register_duplicate_legacy_mixed_case_email(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+    ) -> None:
+        """Test registration conflicts with a stored email differing by case."""
+        test_session.add(
+            User(email="Legacy@Example.com", password_hash="x", name="Legacy")
+        )
+        await test_session.commit()
+
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "legacy@example.com",
+                "password": "password123",
+                "name": "Second User",
+            },
+        )
+
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_register_invalid_email(self, client: AsyncClient) -> None:
         """Test registration with invalid email fails."""
@@ -78,6 +118,39 @@ class TestRegister:
         assert response.status_code == 422
 
 
+    @pytest.mark.asyncio
+    async def test_register_password_over_72_bytes(self, client: AsyncClient) -> None:
+        """Test registration rejects passwords bcrypt cannot hash."""
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "longpass@example.com",
+                "password": "é" * 40,
+                "name": "Test User",
+            },
+        )
+
+        assert response.status_code == 422
+
+
+    @pytest.mark.asyncio
+    async def test_register_after_app_shutdown(self, client: AsyncClient) -> None:
+        """Test password hashing still works after a lifespan shutdown."""
+        with TestClient(app):
+            pass
+
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "restart@example.com",
+                "password": "password123",
+                "name": "Restart User",
+            },
+        )
+
+        assert response.status_code == 201
+
+
 class TestLogin:
     """Tests for user login."""
 
@@ -108,6 +181,92 @@ class TestLogin:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
+    @pytest.mark.asyncio
+    async def test_login_email_case_insensitive(self, client: AsyncClient) -> None:
+        """Test login matches the registered email regardless of case."""
+        await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "Mixed.Case@example.com",
+                "password": "password123",
+                "name": "Case User",
+            },
+        )
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": " MIXED.CASE@example.com ",
+                "password": "password123",
+            },
+        )
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_login_rehashes_to_configured_scheme(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test login upgrades a bcrypt hash when argon2 is configured."""
+        credentials = {"email": "rehash@example.com", "password": "password123"}
+        await client.post(
+            "/api/v1/auth/register",
+            json={**credentials, "name": "Rehash User"},
+        )
+        monkeypatch.setattr(settings, "password_hash_scheme", "argon2")
+
+        for _ in range(2):
+            response = await client.post("/api/v1/auth/login", json=credentials)
+            assert response.status_code == 200
+
+        stored_hash = await test_session.scalar(
+            select(User.password_hash).where(User.email == credentials["email"])
+        )
+        assert stored_hash is not None
+        assert stored_hash.startswith("$argon2id$")
+
+    @pytest.mark.asyncio
+    async def test_login_served_from_cache(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+    ) -> None:
+        """Test a repeat login is answered from the cache without a DB lookup."""
+        credentials = {"email": "cached@example.com", "password": "password123"}
+        await client.post(
+            "/api/v1/auth/register",
+            json={**credentials, "name": "Cached User"},
+        )
+        response = await client.post("/api/v1/auth/login", json=credentials)
+        assert response.status_code == 200
+        assert credentials["email"] in _USER_CACHE
+
+        # With the row gone, only a cache hit can authenticate the login
+        await test_session.execute(delete(User))
+        await test_session.commit()
+        response = await client.post("/api/v1/auth/login", json=credentials)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_register_evicts_cached_login(self, client: AsyncClient) -> None:
+        """Test registering an email evicts its cached login snapshot."""
+        _USER_CACHE["evict@example.com"] = AuthUser(999, b"stale", True)
+
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "evict@example.com",
+                "password": "password123",
+                "name": "Evict User",
+            },
+        )
+
+        assert response.status_code == 201
+        assert "evict@example.com" not in _USER_CACHE
+
     @pytest.mark.asyncio
     async def test_login_wrong_password(self, client: AsyncClient) -> None:
         """Test login with wrong password fails."""
@@ -133,6 +292,25 @@ class TestLogin:
         assert response.status_code == 401
         assert "Invalid email or password" in response.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_login_password_over_72_bytes(self, client: AsyncClient) -> None:
+        """Test login with an over-long password fails cleanly."""
+        await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "longlogin@example.com",
+                "password": "password123",
+                "name": "Test User",
+            },
+        )
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": "longlogin@example.com", "password": "x" * 100},
+        )
+
+        assert response.status_code == 401
+
     @pytest.mark.asyncio
     async def test_login_nonexistent_user(self, client: AsyncClient) -> None:
         """Test login with non-existent user fails."""
@@ -202,6 +380,16 @@ class TestProtectedRoutes:
 
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_get_me_malformed_header(self, client: AsyncClient) -> None:
+        """Test a non-Bearer Authorization header is rejected."""
+        response = await client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": "Basic dXNlcjpwYXNz"},
+        )
+
+        assert response.status_code == 401
+
     @pytest.mark.asyncio
     async def test_refresh_token(self, client: AsyncClient) -> None:
         """Test refreshing access token."""
@@ -258,6 +446,30 @@ class TestPasswordHashing:
 
         assert hash1 != hash2  # Salts should be different
 
+    def test_bcrypt_cost(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test bcrypt uses the configured cost and flags other costs."""
+        monkeypatch.setattr(settings, "bcrypt_cost", 4)
+        hashed = hash_password("mysecretpassword")
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("mysecretpassword", hashed)
+        assert not password_needs_rehash(hashed)
+
+        monkeypatch.setattr(settings, "bcrypt_cost", 5)
+        assert password_needs_rehash(hashed)
+
+    def test_argon2_scheme(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test argon2 hashing and lazy migration of bcrypt hashes."""
+        bcrypt_hash = hash_password("mysecretpassword")
+        monkeypatch.setattr(settings, "password_hash_scheme", "argon2")
+        hashed = hash_password("mysecretpassword")
+
+        assert hashed.startswith("$argon2id$")
+        assert verify_password("mysecretpassword", hashed)
+        assert not verify_password("wrongpassword", hashed)
+        assert not password_needs_rehash(hashed)
+        assert password_needs_rehash(bcrypt_hash)
+
 
 class TestTokenCreation:
     """Tests for token creation utilities."""
@@ -270,3 +482,21 @@ class TestTokenCreation:
         assert isinstance(token, str)
         # JWT has 3 parts separated by dots
         assert len(token.split(".")) == 3
+
+
+class TestTokenDecoding:
+    """Tests for token decoding utilities."""
+
+    def test_decode_token_roundtrip(self) -> None:
+        """Test decoding returns the encoded user ID, including cached hits."""
+        token = create_access_token(user_id=42)
+
+        assert decode_token(token)[0] == 42
+        assert decode_token(token)[0] == 42
+
+    def test_decode_expired_token(self) -> None:
+        """Test decoding an expired token fails."""
+        token = create_access_token(user_id=42, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(AuthenticationError):
+            decode_token(token)
@@ -0,0 +1,25 @@
+"""Tests for database migrations."""
+
+import pytest
+from sqlalchemy import text
+
+from database.migrations import run_migrations
+
+
+@pytest.mark.asyncio
+async def test_run_migrations_lowercases_emails(test_engine) -> None:
+    """Test migrations lowercase stored emails and can be re-run."""
+    async with test_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO users (email, password_hash, name, is_active) "
+                "VALUES ('Legacy@Example.com', 'x', 'Legacy User', 1)"
+            )
+        )
+
+    await run_migrations(test_engine)
+    await run_migrations(test_engine)
+
+    async with test_engine.connect() as conn:
+        emails = (await conn.execute(text("SELECT email FROM users"))).scalars()
+        assert list(emails) == ["legacy@example.com"]